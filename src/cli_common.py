@@ -0,0 +1,133 @@
+"""
+CLI Common
+
+Scaffolding shared by the discovery and revenue entrypoints: the flags they
+both accept, domain normalization, JSON (de)serialization and report output.
+Output-path optimizations (orjson, streamed text, lazy formatting, off-loop
+writes) live here once instead of being maintained in each main().
+
+License: MIT
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Any, Callable, List, Optional
+
+from domains import domain_filename, infer_company_name, normalize_domain  # re-exported for the CLIs
+from rate_limit import DEFAULT_RPM, DEFAULT_TPM, configure_rate_limits
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+
+# =============================================================================
+# JSON
+# =============================================================================
+
+def json_loads(data) -> Any:
+    """Parse JSON from str or bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def write_json(path: str, obj: Any) -> None:
+    """Write obj as indented JSON straight to path, without an intermediate str."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=2)
+
+
+# =============================================================================
+# Arguments
+# =============================================================================
+
+def parse_common_args(parser: argparse.ArgumentParser, cache_ttl_default: int,
+                      output_help: str = "Output file (extension determines format, or use --format)"
+                      ) -> argparse.Namespace:
+    """Add the shared flags to parser, parse argv and apply the rate limits.
+
+    After parsing, args.cache_ttl is None when --no-cache was given, so it can
+    be passed straight to the collectors.
+    """
+
+    parser.add_argument("--company-name", help="Company name (inferred from domain if not provided)")
+    parser.add_argument("--output", "-o", help=output_help)
+    parser.add_argument("--format", "-f", choices=["json", "text", "both"], default="json", help="Output format")
+    parser.add_argument("--no-cache", action="store_true", help="Always call Gemini, ignoring cached responses")
+    parser.add_argument("--cache-ttl", type=int, default=cache_ttl_default,
+                        help=f"Seconds to keep cached responses (default: {cache_ttl_default})")
+    parser.add_argument("--rpm", type=int, default=DEFAULT_RPM,
+                        help="Gemini requests per minute to stay under (default: $GEMINI_RPM or unlimited)")
+    parser.add_argument("--tpm", type=int, default=DEFAULT_TPM,
+                        help="Gemini tokens per minute to stay under (default: $GEMINI_TPM or unlimited)")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Minimal output")
+
+    args = parser.parse_args()
+    if args.no_cache:
+        args.cache_ttl = None
+    configure_rate_limits(args.rpm, args.tpm)
+    return args
+
+
+# =============================================================================
+# Output
+# =============================================================================
+
+def output_base(output: str) -> str:
+    """--output path without its extension; formats add .json/.txt."""
+    return output.rsplit(".", 1)[0] if "." in output else output
+
+
+def write_outputs(base: Optional[str], data: Any, render_text: Callable[[Callable[[str], Any]], Any],
+                  fmt: str, quiet: bool = False) -> List[str]:
+    """Write data as JSON and/or text to {base}.json/.txt, or to stdout when base is None.
+
+    render_text(w) must stream the text report through w; it is only called
+    when the text format was requested. Returns the paths written.
+    """
+
+    need_text = fmt in ("text", "both")
+    need_json = fmt in ("json", "both")
+
+    if base is None:
+        if need_text:
+            render_text(sys.stdout.write)
+            print()
+        if need_text and need_json:
+            print("\n--- JSON ---\n")
+        if need_json:
+            print(json_dumps(data))
+        return []
+
+    paths = []
+    if need_json:
+        write_json(f"{base}.json", data)
+        paths.append(f"{base}.json")
+    if need_text:
+        with open(f"{base}.txt", "w") as f:
+            render_text(f.write)
+        paths.append(f"{base}.txt")
+
+    if not quiet:
+        print(f"\n✅ Saved to {' and '.join(paths)}")
+    return paths
+
+
+async def to_thread(fn, *args):
+    """asyncio.to_thread for Python 3.8: run a blocking call on the default executor."""
+    return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
@@ -33,13 +33,27 @@ import os
 import sys
 import json
 import argparse
+import importlib.util
+import io
+import mmap
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional
+from urllib.parse import urlsplit
 
+import httpx
 from google import genai
 from google.genai import types
 
+from cli_common import json_dumps, json_loads, write_json
+from llm_cache import cache_get, cache_put, make_key
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 
 # =============================================================================
 # Configuration
@@ -53,17 +67,64 @@ if not GEMINI_API_KEY:
 
 GEMINI_MODEL = "gemini-2.0-flash"
 
+# Fenced code block fallback used by extract_json
+_CODEBLOCK_RE = re.compile(r'```(?:json)?\s*(\{[\s\S]*?\})\s*```')
+
 # Minimum relevance score to process in Stage 2
 MIN_RELEVANCE_THRESHOLD = 80
 
+# Maximum number of Gemini calls in flight when processing discovery results
+DEFAULT_CONCURRENCY = 8
+
+# How long processed sources stay in the on-disk response cache
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+# Per-call output budgets, sized to typical responses rather than worst case
+YOUTUBE_MAX_OUTPUT_TOKENS = 2048
+ARTICLE_MAX_OUTPUT_TOKENS = 1024
+
+# Articles processed per discovery run, and how many share one Gemini call
+MAX_ARTICLES = 5
+ARTICLE_BATCH_SIZE = 5
+
+
+# Set from --quiet in main()
+_QUIET = False
+
+
+def _log(message: str) -> None:
+    """Per-source progress line; goes to stderr so it never mixes with report output."""
+    if not _QUIET:
+        print(message, file=sys.stderr)
+
 
 # =============================================================================
 # Gemini Client
 # =============================================================================
 
+# Keep-alive pool sized well above DEFAULT_CONCURRENCY so parallel calls
+# reuse warm TLS connections instead of re-handshaking per request.
+HTTP_POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+# HTTP/2 multiplexes requests over one connection, but httpx needs the
+# optional `h2` package for it (pip install "httpx[http2]").
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
 def create_client() -> genai.Client:
-    """Create Gemini API client."""
-    return genai.Client(api_key=GEMINI_API_KEY)
+    """Create Gemini API client backed by a pooled keep-alive HTTP transport.
+
+    Create this once per run and pass it down; every call through the same
+    client reuses its connection pool.
+    """
+    transport_args = {"http2": HTTP2_AVAILABLE, "limits": HTTP_POOL_LIMITS}
+    return genai.Client(
+        api_key=GEMINI_API_KEY,
+        http_options=types.HttpOptions(
+            client_args=transport_args,
+            async_client_args=transport_args
+        )
+    )
 
 
 # =============================================================================
@@ -72,23 +133,14 @@ def create_client() -> genai.Client:
 
 YOUTUBE_STRATEGIC_PROMPT = """Analyze this video for strategic business intelligence.
 
-Extract:
-1. **Executive Statements**: Any quotes from CEO, founders, or executives about:
-   - Business strategy and priorities
-   - Future plans and expansion
-   - Technology investments
-   - Competitive positioning
-   - Company culture and values
-
-2. **Business Intelligence**:
-   - Recent acquisitions, mergers, or PE involvement
-   - Revenue/growth indicators mentioned
-   - Key partnerships announced
-   - Market positioning statements
-   - Challenges or pain points discussed
-
-3. **Outreach Angles**: What pain points or priorities does this reveal that could be relevant for B2B outreach?
+Extract executive statements (CEO, founders, executives) on strategy, future plans, technology
+investments, competitive positioning and culture; business events such as acquisitions, mergers,
+PE involvement or partnerships; revenue/growth indicators and market positioning; pain points
+discussed; and the B2B outreach angles those pain points and priorities suggest.
+"""
 
+# Only needed with --legacy-parse; otherwise YOUTUBE_SCHEMA enforces the structure
+YOUTUBE_JSON_FORMAT = """
 IMPORTANT: Return ONLY valid JSON (no markdown, no code blocks) matching this structure:
 {
   "executives_found": [
@@ -111,27 +163,65 @@ Return ONLY the JSON object, nothing else.
 """
 
 
+def _object_schema(**properties: types.Schema) -> types.Schema:
+    return types.Schema(type=types.Type.OBJECT, properties=properties)
+
+
+def _array_schema(items: types.Schema) -> types.Schema:
+    return types.Schema(type=types.Type.ARRAY, items=items)
+
+
+_STRING = types.Schema(type=types.Type.STRING)
+
+# Structured output schema for process_youtube; Gemini guarantees the
+# response body is valid JSON of this shape.
+YOUTUBE_SCHEMA = _object_schema(
+    executives_found=_array_schema(_object_schema(
+        name=_STRING, title=_STRING, key_quotes=_array_schema(_STRING)
+    )),
+    strategic_insights=_array_schema(_object_schema(
+        topic=_STRING,
+        detail=_STRING,
+        confidence=types.Schema(type=types.Type.STRING, enum=["high", "medium", "low"])
+    )),
+    business_events=_array_schema(_object_schema(
+        event=_STRING, detail=_STRING, date=_STRING
+    )),
+    pain_points=_array_schema(_STRING),
+    outreach_angles=_array_schema(_object_schema(
+        angle=_STRING, evidence=_STRING
+    )),
+    video_summary=_STRING
+)
+
+
+def _cacheable(result: Dict[str, Any]) -> bool:
+    """Only successful, fully parsed results are worth caching."""
+    return "error" not in result and not result.get("parse_error")
+
+
 def extract_json(text: str) -> Dict[str, Any]:
     """Extract JSON from Gemini response."""
-    # Try direct parse
+    # Try direct parse (orjson.JSONDecodeError subclasses json.JSONDecodeError)
     try:
-        return json.loads(text)
+        return json_loads(text)
     except json.JSONDecodeError:
         pass
 
-    # Try markdown code block
-    match = re.search(r'```(?:json)?\s*(\{[\s\S]*?\})\s*```', text)
-    if match:
+    # Try outermost braces; covers fenced and prose-wrapped objects without regex
+    lo = text.find("{")
+    hi = text.rfind("}")
+    if lo != -1 and hi > lo:
         try:
-            return json.loads(match.group(1))
+            return json_loads(text[lo:hi + 1])
         except json.JSONDecodeError:
             pass
 
-    # Try raw JSON
-    match = re.search(r'\{[\s\S]*\}', text)
+    # Try markdown code block (e.g. stray braces outside the fence)
+    match = _CODEBLOCK_RE.search(text)
     if match:
         try:
-            return json.loads(match.group(0))
+            return json_loads(match.group(1))
         except json.JSONDecodeError:
             pass
 
@@ -143,10 +233,35 @@ def extract_json(text: str) -> Dict[str, Any]:
     }
 
 
-def process_youtube(client: genai.Client, url: str, company_name: str = "") -> Dict[str, Any]:
-    """Process a YouTube video for deep strategic intelligence using Gemini's native video understanding."""
+def process_youtube(client: genai.Client, url: str, company_name: str = "",
+                    legacy_parse: bool = False, cache_ttl: Optional[int] = None) -> Dict[str, Any]:
+    """Process a YouTube video for deep strategic intelligence using Gemini's native video understanding.
+
+    Requests schema-constrained JSON output; legacy_parse instead embeds the
+    structure in the prompt and scrapes the JSON out with extract_json.
+    Results are cached on disk for cache_ttl seconds (None disables the cache).
+    """
+
+    if legacy_parse:
+        prompt = YOUTUBE_STRATEGIC_PROMPT + YOUTUBE_JSON_FORMAT
+        config = types.GenerateContentConfig(temperature=0.2, max_output_tokens=YOUTUBE_MAX_OUTPUT_TOKENS)
+    else:
+        prompt = YOUTUBE_STRATEGIC_PROMPT
+        config = types.GenerateContentConfig(
+            temperature=0.2,
+            max_output_tokens=YOUTUBE_MAX_OUTPUT_TOKENS,
+            response_mime_type="application/json",
+            response_schema=YOUTUBE_SCHEMA
+        )
 
-    print(f"      Processing YouTube: {url[:60]}...")
+    cache_key = make_key(GEMINI_MODEL, "youtube", url, prompt)
+    if cache_ttl:
+        cached = cache_get(cache_key)
+        if cached is not None:
+            _log(f"      Cached YouTube: {url[:60]}")
+            return cached
+
+    _log(f"      Processing YouTube: {url[:60]}...")
 
     try:
         # Use Gemini's native YouTube understanding
@@ -156,7 +271,7 @@ def process_youtube(client: genai.Client, url: str, company_name: str = "") -> D
                 types.Content(
                     role="user",
                     parts=[
-                        types.Part(text=YOUTUBE_STRATEGIC_PROMPT),
+                        types.Part(text=prompt),
                         types.Part(
                             file_data=types.FileData(
                                 file_uri=url,
@@ -166,20 +281,20 @@ def process_youtube(client: genai.Client, url: str, company_name: str = "") -> D
                     ]
                 )
             ],
-            config=types.GenerateContentConfig(
-                temperature=0.2,
-                max_output_tokens=4000
-            )
+            config=config
         )
 
-        result = extract_json(response.text)
+        result = extract_json(response.text) if legacy_parse else json_loads(response.text)
         result["source_url"] = url
         result["source_type"] = "youtube"
 
+        if cache_ttl and _cacheable(result):
+            cache_put(cache_key, result, cache_ttl)
+
         return result
 
     except Exception as e:
-        print(f"      YouTube processing error: {e}")
+        print(f"      YouTube processing error: {e}", file=sys.stderr)
         return {
             "error": str(e),
             "source_url": url,
@@ -191,44 +306,66 @@ def process_youtube(client: genai.Client, url: str, company_name: str = "") -> D
 # Article/News Deep Processing
 # =============================================================================
 
-NEWS_STRATEGIC_PROMPT = """Analyze this news article or press release for strategic business intelligence about {company_name}.
+_NEWS_ANALYSIS = """strategic business intelligence about {company_name}:
+key announcements, attributed executive quotes, strategic implications, metrics mentioned, and competitive context.
+"""
 
-Extract:
-1. Key announcements or news
-2. Executive quotes (with attribution)
-3. Strategic implications
-4. Any metrics or numbers mentioned
-5. Competitive context
+_NEWS_KEYS = """headline_summary (one sentence), key_announcements (string[]),
+executive_quotes ({{speaker, title, quote}}[]), metrics_mentioned ({{metric, value, context}}[]),
+strategic_implications (string[]), outreach_relevance (integer 0-100)"""
 
-IMPORTANT: Return ONLY valid JSON (no markdown, no code blocks) matching this structure:
-{{
-  "headline_summary": "One sentence summary",
-  "key_announcements": ["announcement1", "announcement2"],
-  "executive_quotes": [
-    {{"speaker": "Name", "title": "Title", "quote": "The quote"}}
-  ],
-  "metrics_mentioned": [{{"metric": "revenue", "value": "$50M", "context": "annual"}}],
-  "strategic_implications": ["implication1", "implication2"],
-  "outreach_relevance": 85
-}}
+NEWS_STRATEGIC_PROMPT = ("Analyze this news article or press release for " + _NEWS_ANALYSIS + """
+Return ONLY a JSON object (no markdown) with keys: """ + _NEWS_KEYS + ".\n")
+
+# Batched counterpart of NEWS_STRATEGIC_PROMPT with its own output instruction
+NEWS_BATCH_PROMPT = ("Analyze EACH numbered URL below as a separate news article or press release for "
+                     + _NEWS_ANALYSIS + """
+Return ONLY a JSON object (no markdown) of the form {{"articles": [...]}} holding one object per URL,
+in list order, each with keys: source_url (the URL exactly as listed), """ + _NEWS_KEYS + """.
+
+URLs:
+{url_list}
+""")
 
-Return ONLY the JSON object, nothing else.
-"""
 
+def _article_tool(grounded: bool) -> types.Tool:
+    """Fetch known URLs directly; Google Search grounding adds a search hop per call."""
+    if grounded:
+        return types.Tool(google_search=types.GoogleSearch())
+    return types.Tool(url_context=types.UrlContext())
 
-def process_article(client: genai.Client, url: str, company_name: str) -> Dict[str, Any]:
-    """Process a news article or press release for strategic intel."""
 
-    print(f"      Processing article: {url[:50]}...")
+def _article_cache_key(url: str, prompt: str, grounded: bool) -> str:
+    # Shared by the single and batched paths; both produce the same result shape
+    return make_key(GEMINI_MODEL, "article", url, prompt, "grounded" if grounded else "url_context")
+
+
+def process_article(client: genai.Client, url: str, prompt: str,
+                    cache_ttl: Optional[int] = None, grounded: bool = False) -> Dict[str, Any]:
+    """Process a news article or press release for strategic intel.
+
+    prompt is NEWS_STRATEGIC_PROMPT already formatted for the company, so a
+    run formats it once rather than per URL. The page is fetched with Gemini's
+    URL context tool; grounded=True uses Google Search grounding instead.
+    """
+
+    cache_key = _article_cache_key(url, prompt, grounded)
+    if cache_ttl:
+        cached = cache_get(cache_key)
+        if cached is not None:
+            _log(f"      Cached article: {url[:50]}")
+            return cached
+
+    _log(f"      Processing article: {url[:50]}...")
 
     try:
         response = client.models.generate_content(
             model=GEMINI_MODEL,
-            contents=NEWS_STRATEGIC_PROMPT.format(company_name=company_name) + f"\n\nURL: {url}",
+            contents=prompt + f"\n\nURL: {url}",
             config=types.GenerateContentConfig(
                 temperature=0.2,
-                max_output_tokens=2000,
-                tools=[types.Tool(google_search=types.GoogleSearch())]
+                max_output_tokens=ARTICLE_MAX_OUTPUT_TOKENS,
+                tools=[_article_tool(grounded)]
             )
         )
 
@@ -236,10 +373,13 @@ def process_article(client: genai.Client, url: str, company_name: str) -> Dict[s
         result["source_url"] = url
         result["source_type"] = "article"
 
+        if cache_ttl and _cacheable(result):
+            cache_put(cache_key, result, cache_ttl)
+
         return result
 
     except Exception as e:
-        print(f"      Article processing error: {e}")
+        print(f"      Article processing error: {e}", file=sys.stderr)
         return {
             "error": str(e),
             "source_url": url,
@@ -247,6 +387,103 @@ def process_article(client: genai.Client, url: str, company_name: str) -> Dict[s
         }
 
 
+def process_articles_batch(client: genai.Client, urls: List[str], company_name: str,
+                           cache_ttl: Optional[int] = None, grounded: bool = False) -> List[Dict[str, Any]]:
+    """Process several articles in one Gemini call using NEWS_BATCH_PROMPT.
+
+    Returns one result per URL, in the same order as urls. Results share
+    process_article's cache entries; cached URLs are served from disk and
+    left out of the batch prompt.
+    """
+
+    # Cache identity is the single-article prompt, so both paths hit the same entries
+    prompt = NEWS_STRATEGIC_PROMPT.format(company_name=company_name)
+    by_url = {}
+
+    if cache_ttl:
+        for url in urls:
+            cached = cache_get(_article_cache_key(url, prompt, grounded))
+            if cached is not None:
+                _log(f"      Cached article: {url[:50]}")
+                by_url[url] = cached
+
+    pending = [url for url in dict.fromkeys(urls) if url not in by_url]
+    if pending:
+        by_url.update(_run_article_batch(client, pending, company_name, prompt, cache_ttl, grounded))
+
+    return [by_url[url] for url in urls]
+
+
+def _url_identity(url: str) -> tuple:
+    """Comparable form of a URL that ignores scheme, www., trailing slash and fragment."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return host, parts.path.rstrip("/"), parts.query
+
+
+def _run_article_batch(client: genai.Client, urls: List[str], company_name: str, prompt: str,
+                       cache_ttl: Optional[int], grounded: bool) -> Dict[str, Dict[str, Any]]:
+    """Send one batched article prompt; returns results keyed by URL."""
+
+    _log(f"      Processing {len(urls)} articles in one batch...")
+
+    url_list = "\n".join(f"{i}. {url}" for i, url in enumerate(urls, 1))
+
+    try:
+        response = client.models.generate_content(
+            model=GEMINI_MODEL,
+            contents=NEWS_BATCH_PROMPT.format(company_name=company_name, url_list=url_list),
+            config=types.GenerateContentConfig(
+                temperature=0.2,
+                max_output_tokens=ARTICLE_MAX_OUTPUT_TOKENS * len(urls),
+                tools=[_article_tool(grounded)]
+            )
+        )
+
+        articles = extract_json(response.text).get("articles")
+        if not isinstance(articles, list):
+            raise ValueError("Batch response did not contain an articles list")
+
+    except Exception as e:
+        print(f"      Article batch processing error: {e}", file=sys.stderr)
+        return {url: {"error": str(e), "source_url": url, "source_type": "article"} for url in urls}
+
+    # Match results to URLs by the source_url Gemini echoes back. Position is
+    # only trusted when the counts line up or an entry omits its URL, and those
+    # guesses are never cached.
+    wanted = {_url_identity(url): url for url in urls}
+    matched = {}
+    for art in articles:
+        returned = art.get("source_url") if isinstance(art, dict) else None
+        if isinstance(returned, str) and _url_identity(returned) in wanted:
+            matched.setdefault(wanted[_url_identity(returned)], art)
+    claimed = {id(art) for art in matched.values()}
+    by_position = len(articles) == len(urls)
+
+    results = {}
+    for i, url in enumerate(urls):
+        confirmed = url in matched
+        guess = articles[i] if i < len(articles) else None
+        if confirmed:
+            result = matched[url]
+        elif (isinstance(guess, dict) and id(guess) not in claimed
+              and (by_position or not guess.get("source_url"))):
+            result = guess
+        else:
+            result = {"error": "No result returned for this URL in batch"}
+        result["source_url"] = url
+        result["source_type"] = "article"
+
+        if cache_ttl and confirmed and _cacheable(result):
+            cache_put(_article_cache_key(url, prompt, grounded), result, cache_ttl)
+
+        results[url] = result
+
+    return results
+
+
 # =============================================================================
 # Discovery Results Processing
 # =============================================================================
@@ -254,14 +491,30 @@ def process_article(client: genai.Client, url: str, company_name: str) -> Dict[s
 def load_discovery_results(filepath: str) -> Dict[str, Any]:
     """Load Stage 1 discovery results from JSON file."""
 
-    with open(filepath, 'r') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"{filepath} is empty")
+
+        if orjson is None:
+            return json.load(f)
+
+        # Parse straight from the mapped pages instead of read()ing a copy
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release()
 
 
 def get_high_relevance_sources(discovery_data: Dict[str, Any], threshold: int = MIN_RELEVANCE_THRESHOLD) -> List[Dict]:
-    """Extract high-relevance sources from discovery results."""
+    """Extract high-relevance sources from discovery results.
+
+    A URL quoted by several statements is returned once, using the
+    highest-relevance statement, so it is only processed once.
+    """
 
-    sources = []
+    sources = {}
     statements = discovery_data.get("strategic_statements", [])
 
     for stmt in statements:
@@ -269,16 +522,20 @@ def get_high_relevance_sources(discovery_data: Dict[str, Any], threshold: int =
         source_url = stmt.get("source_url", "")
         source_type = stmt.get("source_type", "")
 
-        if relevance >= threshold and source_url:
-            sources.append({
-                "url": source_url,
-                "type": source_type,
-                "relevance": relevance,
-                "source_name": stmt.get("source_name", ""),
-                "snippet": stmt.get("statement", "")[:200]
-            })
+        if relevance < threshold or not source_url:
+            continue
+        if source_url in sources and relevance <= sources[source_url]["relevance"]:
+            continue
+
+        sources[source_url] = {
+            "url": source_url,
+            "type": source_type,
+            "relevance": relevance,
+            "source_name": stmt.get("source_name", ""),
+            "snippet": stmt.get("statement", "")[:200]
+        }
 
-    return sources
+    return list(sources.values())
 
 
 # =============================================================================
@@ -317,8 +574,24 @@ def merge_deep_intel(company_name: str, domain: str, youtube_results: List[Dict]
         if "executive_quotes" in art:
             merged["key_quotes"].extend(art["executive_quotes"])
 
-    # Deduplicate pain points
-    merged["pain_points"] = list(set(merged["pain_points"]))
+    # Deduplicate in first-seen order so reports are deterministic
+    merged["pain_points"] = list(dict.fromkeys(merged["pain_points"]))
+
+    insights = {}
+    for ins in merged["strategic_insights"]:
+        insights.setdefault((ins.get("topic"), ins.get("detail")), ins)
+    merged["strategic_insights"] = list(insights.values())
+
+    # The same executive often appears in several videos; fold their quotes together
+    executives = {}
+    for ex in merged["executives_found"]:
+        key = (ex.get("name"), ex.get("title"))
+        if key in executives:
+            seen = executives[key]
+            seen["key_quotes"] = list(dict.fromkeys((seen.get("key_quotes") or []) + (ex.get("key_quotes") or [])))
+        else:
+            executives[key] = dict(ex)
+    merged["executives_found"] = list(executives.values())
 
     return merged
 
@@ -330,87 +603,88 @@ def merge_deep_intel(company_name: str, domain: str, youtube_results: List[Dict]
 def format_text_report(data: Dict[str, Any]) -> str:
     """Format deep analysis results as human-readable text."""
 
-    lines = []
-    lines.append("=" * 70)
-    lines.append(f"DEEP ANALYSIS REPORT: {data.get('company_name', 'Unknown')}")
-    lines.append(f"Domain: {data.get('domain', 'Unknown')}")
-    lines.append(f"Processed: {data.get('processed_at', datetime.now().isoformat())}")
-    lines.append("=" * 70)
+    buf = io.StringIO()
+    w = buf.write
+    w("=" * 70 + "\n")
+    w(f"DEEP ANALYSIS REPORT: {data.get('company_name', 'Unknown')}\n")
+    w(f"Domain: {data.get('domain', 'Unknown')}\n")
+    w(f"Processed: {data.get('processed_at', datetime.now().isoformat())}\n")
+    w("=" * 70 + "\n")
 
     # Executives Found
     executives = data.get("executives_found", [])
     if executives:
-        lines.append(f"\n## EXECUTIVES FOUND ({len(executives)})\n")
+        w(f"\n## EXECUTIVES FOUND ({len(executives)})\n\n")
         for exec in executives:
-            lines.append(f"  • {exec.get('name', 'Unknown')} — {exec.get('title', 'Unknown')}")
+            w(f"  • {exec.get('name', 'Unknown')} — {exec.get('title', 'Unknown')}\n")
             quotes = exec.get("key_quotes", [])
             for q in quotes[:2]:  # Show first 2 quotes
-                lines.append(f"    \"{q[:100]}...\"" if len(q) > 100 else f"    \"{q}\"")
-            lines.append("")
+                w(f"    \"{q[:100]}...\"\n" if len(q) > 100 else f"    \"{q}\"\n")
+            w("\n")
     else:
-        lines.append("\n## EXECUTIVES FOUND\n")
-        lines.append("  No executives identified")
+        w("\n## EXECUTIVES FOUND\n\n")
+        w("  No executives identified\n")
 
     # Strategic Insights
     insights = data.get("strategic_insights", [])
     if insights:
-        lines.append(f"\n## STRATEGIC INSIGHTS ({len(insights)})\n")
+        w(f"\n## STRATEGIC INSIGHTS ({len(insights)})\n\n")
         for i, ins in enumerate(insights, 1):
             topic = ins.get("topic", "general")
             detail = ins.get("detail", "")
             confidence = ins.get("confidence", "medium")
-            lines.append(f"  [{i}] {topic.upper()} ({confidence})")
-            lines.append(f"      {detail}")
-            lines.append("")
+            w(f"  [{i}] {topic.upper()} ({confidence})\n")
+            w(f"      {detail}\n")
+            w("\n")
     else:
-        lines.append("\n## STRATEGIC INSIGHTS\n")
-        lines.append("  No strategic insights extracted")
+        w("\n## STRATEGIC INSIGHTS\n\n")
+        w("  No strategic insights extracted\n")
 
     # Pain Points
     pain_points = data.get("pain_points", [])
     if pain_points:
-        lines.append(f"\n## PAIN POINTS IDENTIFIED ({len(pain_points)})\n")
+        w(f"\n## PAIN POINTS IDENTIFIED ({len(pain_points)})\n\n")
         for pp in pain_points:
-            lines.append(f"  • {pp}")
+            w(f"  • {pp}\n")
     else:
-        lines.append("\n## PAIN POINTS IDENTIFIED\n")
-        lines.append("  None identified")
+        w("\n## PAIN POINTS IDENTIFIED\n\n")
+        w("  None identified\n")
 
     # Outreach Angles
     angles = data.get("outreach_angles", [])
     if angles:
-        lines.append(f"\n## OUTREACH ANGLES ({len(angles)})\n")
+        w(f"\n## OUTREACH ANGLES ({len(angles)})\n\n")
         for i, angle in enumerate(angles, 1):
-            lines.append(f"  [{i}] {angle.get('angle', '')}")
+            w(f"  [{i}] {angle.get('angle', '')}\n")
             if angle.get("evidence"):
-                lines.append(f"      Evidence: {angle['evidence'][:100]}...")
-            lines.append("")
+                w(f"      Evidence: {angle['evidence'][:100]}...\n")
+            w("\n")
     else:
-        lines.append("\n## OUTREACH ANGLES\n")
-        lines.append("  No specific outreach angles identified")
+        w("\n## OUTREACH ANGLES\n\n")
+        w("  No specific outreach angles identified\n")
 
     # Key Quotes
     quotes = data.get("key_quotes", [])
     if quotes:
-        lines.append(f"\n## KEY EXECUTIVE QUOTES ({len(quotes)})\n")
+        w(f"\n## KEY EXECUTIVE QUOTES ({len(quotes)})\n\n")
         for q in quotes:
             speaker = q.get("speaker", "Unknown")
             title = q.get("title", "")
             quote = q.get("quote", "")
-            lines.append(f"  \"{quote[:150]}...\"" if len(quote) > 150 else f"  \"{quote}\"")
-            lines.append(f"    — {speaker}" + (f", {title}" if title else ""))
-            lines.append("")
+            w(f"  \"{quote[:150]}...\"\n" if len(quote) > 150 else f"  \"{quote}\"\n")
+            w(f"    — {speaker}" + (f", {title}" if title else "") + "\n")
+            w("\n")
 
     # Sources Summary
     yt_count = len(data.get("youtube_intel", []))
     art_count = len(data.get("article_intel", []))
-    lines.append(f"\n## SOURCES PROCESSED\n")
-    lines.append(f"  YouTube videos: {yt_count}")
-    lines.append(f"  Articles/News: {art_count}")
+    w(f"\n## SOURCES PROCESSED\n\n")
+    w(f"  YouTube videos: {yt_count}\n")
+    w(f"  Articles/News: {art_count}\n")
 
-    lines.append("\n" + "=" * 70)
+    w("\n" + "=" * 70)
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # =============================================================================
@@ -418,6 +692,8 @@ def format_text_report(data: Dict[str, Any]) -> str:
 # =============================================================================
 
 def main():
+    global _QUIET
+
     parser = argparse.ArgumentParser(
         description="Deep content analysis using Gemini"
     )
@@ -430,10 +706,24 @@ def main():
     parser.add_argument("--format", "-f", choices=["json", "text", "both"], default="json")
     parser.add_argument("--threshold", "-t", type=int, default=MIN_RELEVANCE_THRESHOLD,
                         help=f"Minimum relevance score to process (default: {MIN_RELEVANCE_THRESHOLD})")
+    parser.add_argument("--concurrency", "-c", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Maximum parallel Gemini calls (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--legacy-parse", action="store_true",
+                        help="Scrape JSON from free-form YouTube responses instead of requesting structured output")
+    parser.add_argument("--grounded", action="store_true",
+                        help="Analyze articles via Google Search grounding instead of fetching the URL directly")
+    parser.add_argument("--no-cache", action="store_true", help="Always call Gemini, ignoring cached results")
+    parser.add_argument("--cache-ttl", type=int, default=CACHE_TTL_SECONDS,
+                        help=f"Seconds to keep cached results (default: {CACHE_TTL_SECONDS})")
     parser.add_argument("--quiet", "-q", action="store_true", help="Minimal output")
 
     args = parser.parse_args()
 
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    _QUIET = args.quiet
+
     if not args.youtube_url and not args.article_url and not args.input:
         parser.error("One of --youtube-url, --article-url, or --input is required")
 
@@ -443,6 +733,7 @@ def main():
         print(f"{'='*60}")
 
     client = create_client()
+    cache_ttl = None if args.no_cache else args.cache_ttl
     youtube_results = []
     article_results = []
 
@@ -450,7 +741,7 @@ def main():
     if args.youtube_url:
         if not args.quiet:
             print(f"\n[1/2] Processing YouTube video...")
-        result = process_youtube(client, args.youtube_url, args.company_name or "")
+        result = process_youtube(client, args.youtube_url, args.company_name or "", args.legacy_parse, cache_ttl)
         youtube_results.append(result)
 
         if not args.quiet:
@@ -464,7 +755,9 @@ def main():
     elif args.article_url:
         if not args.quiet:
             print(f"\n[1/2] Processing article...")
-        result = process_article(client, args.article_url, args.company_name or "Unknown")
+        article_prompt = NEWS_STRATEGIC_PROMPT.format(company_name=args.company_name or "Unknown")
+        result = process_article(client, args.article_url, article_prompt,
+                                 cache_ttl, grounded=args.grounded)
         article_results.append(result)
 
         if not args.quiet:
@@ -500,30 +793,41 @@ def main():
         if not args.quiet:
             print(f"      YouTube: {len(yt_sources)}, Articles: {len(art_sources)}")
 
-        # Process YouTube
-        if yt_sources:
-            if not args.quiet:
-                print(f"\n[2/4] Deep processing {len(yt_sources)} YouTube sources...")
-            for src in yt_sources:
-                result = process_youtube(client, src["url"], company_name)
-                result["original_relevance"] = src["relevance"]
-                result["source_name"] = src.get("source_name", "")
-                youtube_results.append(result)
-        else:
-            if not args.quiet:
-                print(f"\n[2/4] No YouTube sources to process")
+        art_sources = art_sources[:MAX_ARTICLES]
+        batches = [art_sources[i:i + ARTICLE_BATCH_SIZE]
+                   for i in range(0, len(art_sources), ARTICLE_BATCH_SIZE)]
 
-        # Process articles
-        if art_sources:
-            if not args.quiet:
-                print(f"\n[3/4] Deep processing {len(art_sources)} articles...")
-            for src in art_sources[:5]:  # Limit to 5 articles
-                result = process_article(client, src["url"], company_name)
+        def _youtube(src: Dict) -> Dict[str, Any]:
+            result = process_youtube(client, src["url"], company_name, args.legacy_parse, cache_ttl)
+            result["original_relevance"] = src["relevance"]
+            result["source_name"] = src.get("source_name", "")
+            return result
+
+        def _article_batch(batch: List[Dict]) -> List[Dict[str, Any]]:
+            results = process_articles_batch(client, [src["url"] for src in batch], company_name,
+                                             cache_ttl, grounded=args.grounded)
+            for src, result in zip(batch, results):
                 result["original_relevance"] = src["relevance"]
-                article_results.append(result)
-        else:
-            if not args.quiet:
-                print(f"\n[3/4] No articles to process")
+            return results
+
+        if not args.quiet:
+            if yt_sources:
+                print(f"\n[2/4] Deep processing {len(yt_sources)} YouTube sources...")
+            else:
+                print(f"\n[2/4] No YouTube sources to process")
+            if art_sources:
+                print(f"[3/4] Deep processing {len(art_sources)} articles...")
+            else:
+                print(f"[3/4] No articles to process")
+
+        # Calls are I/O-bound and independent, so both stages share one pool and
+        # run concurrently; map() submits eagerly and preserves source order
+        with ThreadPoolExecutor(max_workers=args.concurrency) as ex:
+            yt_pending = ex.map(_youtube, yt_sources)
+            art_pending = ex.map(_article_batch, batches)
+            youtube_results.extend(yt_pending)
+            for results in art_pending:
+                article_results.extend(results)
 
         if not args.quiet:
             print(f"\n[4/4] Merging results...")
@@ -541,17 +845,15 @@ def main():
         "article_count": len(article_results)
     }
 
-    # Format outputs
-    text_output = format_text_report(deep_intel)
-    json_output = json.dumps(deep_intel, indent=2)
+    # Format outputs (the text report is skipped entirely for --format json)
+    text_output = format_text_report(deep_intel) if args.format in ["text", "both"] else None
 
     # Output
     if args.output:
         base = args.output.rsplit(".", 1)[0] if "." in args.output else args.output
 
         if args.format in ["json", "both"]:
-            with open(f"{base}.json", "w") as f:
-                f.write(json_output)
+            write_json(f"{base}.json", deep_intel)
             if not args.quiet:
                 print(f"\n JSON saved to {base}.json")
 
@@ -562,13 +864,13 @@ def main():
                 print(f" Text saved to {base}.txt")
     else:
         if args.format == "json":
-            print(json_output)
+            print(json_dumps(deep_intel))
         elif args.format == "text":
             print(text_output)
         else:
             print(text_output)
             print("\n--- JSON ---\n")
-            print(json_output)
+            print(json_dumps(deep_intel))
 
     if not args.quiet:
         print(f"\n{'='*60}")
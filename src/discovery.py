@@ -18,35 +18,64 @@ Requirements:
 
 Environment:
     GEMINI_API_KEY - Your Google AI Studio API key
+    GEMINI_API_KEYS - Optional comma-separated keys from different projects;
+                      calls are spread across them (see key_pool.py)
 
 Author: Binary Anvil
 License: MIT
 """
 
 import argparse
+import asyncio
+import heapq
+import io
 import json
 import os
 import re
 import sys
 import time
 from datetime import datetime
-from typing import Optional
+from typing import Any, Callable, List, Optional
 
 from google import genai
 from google.genai import types
 
+from cli_common import (domain_filename, infer_company_name, json_loads, normalize_domain,
+                        output_base, parse_common_args, to_thread, write_outputs)
+from gemini_retry import call_with_retry_async, error_info
+from key_pool import KeyPool, api_keys_from_env
+from llm_cache import cache_get, cache_put, make_key
+from rate_limit import estimate_tokens, throttled
+from revenue import calculate_confidence, research_revenue_async
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY")
-if not GEMINI_API_KEY:
+GEMINI_API_KEYS = api_keys_from_env()
+if not GEMINI_API_KEYS:
     print("Error: GEMINI_API_KEY environment variable not set")
     print("Get your API key at: https://aistudio.google.com/app/apikey")
     sys.exit(1)
+GEMINI_API_KEY = GEMINI_API_KEYS[0]
 
 GEMINI_MODEL = "gemini-2.0-flash"
 
+# How long Gemini responses stay in the on-disk cache
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Extra passes over batch domains that failed with a retryable error, and the
+# wait before each (on top of the per-call backoff in gemini_retry)
+BATCH_RETRY_ROUNDS = 2
+BATCH_RETRY_DELAY_SECONDS = 60
+
+# Domains collected at once in --domains-file mode; keeps bursts under Gemini RPM limits
+DEFAULT_BATCH_CONCURRENCY = 4
+
+# JSON extraction patterns used by extract_json (fenced code block, then bare object)
+_CODEBLOCK_RE = re.compile(r'```(?:json)?\s*(\{[\s\S]*?\})\s*```')
+_RAWJSON_RE = re.compile(r'\{[\s\S]*\}')
+
 # Strategic themes to look for
 RELEVANT_THEMES = [
     "mobile_commerce",
@@ -134,6 +163,11 @@ Strategic themes to look for: {themes}
 
 Return ONLY the JSON object."""
 
+# Themes are constant, so fill them in once; sorted so the prompt text (and
+# with it the response cache key) doesn't depend on RELEVANT_THEMES ordering
+_THEMES_STR = ", ".join(sorted(RELEVANT_THEMES))
+_DISCOVERY_TEMPLATE = DISCOVERY_PROMPT.replace("{themes}", _THEMES_STR)
+
 
 ACQUIRER_PROMPT = """Search for strategic intelligence about {acquirer_name} ({acquirer_domain}).
 
@@ -174,141 +208,450 @@ Return ONLY the JSON object."""
 # GEMINI CLIENT
 # =============================================================================
 
+_CLIENT = None
+
+
 def create_client():
-    """Initialize Gemini client."""
-    return genai.Client(api_key=GEMINI_API_KEY)
+    """Return the shared Gemini client (a KeyPool with several keys), creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = KeyPool.from_env() if len(GEMINI_API_KEYS) > 1 else genai.Client(api_key=GEMINI_API_KEY)
+    return _CLIENT
 
 
 def extract_json(text: str) -> dict:
     """Extract JSON from Gemini's response."""
-    # Try code blocks first
-    match = re.search(r'```(?:json)?\s*(\{[\s\S]*?\})\s*```', text)
+    # Try direct parse (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+    try:
+        return json_loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    # Try code blocks
+    match = _CODEBLOCK_RE.search(text)
     if match:
         try:
-            return json.loads(match.group(1))
+            return json_loads(match.group(1))
         except json.JSONDecodeError:
             pass
 
     # Try raw JSON
-    match = re.search(r'\{[\s\S]*\}', text)
+    match = _RAWJSON_RE.search(text)
     if match:
         try:
-            return json.loads(match.group(0))
+            return json_loads(match.group(0))
         except json.JSONDecodeError:
             pass
 
-    return {"error": "JSON parsing failed", "raw_response": text[:500]}
+    # Tagged like error_info() so callers treat it as a failure, not "nothing found"
+    return {"error": "JSON parsing failed", "error_class": "ParseError", "retryable": False,
+            "raw_response": text[:500]}
 
 
 # =============================================================================
 # INTELLIGENCE COLLECTION
 # =============================================================================
+#
+# Collectors are async (client.aio) so independent Gemini calls can run
+# concurrently under asyncio.gather; main() wraps them in asyncio.run.
 
-def collect_company_intel(client, domain: str, company_name: str) -> dict:
-    """Collect strategic intelligence about a company."""
-
-    prompt = DISCOVERY_PROMPT.format(
-        company_name=company_name,
-        domain=domain,
-        themes=", ".join(RELEVANT_THEMES)
-    )
-
-    config = types.GenerateContentConfig(
+def _search_config():
+    return types.GenerateContentConfig(
         tools=[types.Tool(google_search=types.GoogleSearch())],
         temperature=0.2,
     )
 
+
+async def _generate_async(client, prompt: str, cache_ttl: Optional[int]) -> dict:
+    """Run a search-grounded prompt, serving repeats from the on-disk cache.
+
+    The raw response text is cached for cache_ttl seconds (None disables the
+    cache); responses that fail to parse are never cached.
+    """
+
+    cache_key = make_key(GEMINI_MODEL, prompt)
+    if cache_ttl:
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return extract_json(cached)
+
+    response = await call_with_retry_async(throttled(lambda: client.aio.models.generate_content(
+        model=GEMINI_MODEL,
+        contents=prompt,
+        config=_search_config()
+    ), estimate_tokens(prompt)))
+    result = extract_json(response.text)
+
+    if cache_ttl and "error" not in result:
+        cache_put(cache_key, response.text, cache_ttl)
+    return result
+
+
+def _company_prompt(domain: str, company_name: str) -> str:
+    return _DISCOVERY_TEMPLATE.format(company_name=company_name, domain=domain)
+
+
+async def collect_company_intel_async(client, domain: str, company_name: str,
+                                      cache_ttl: Optional[int] = None) -> dict:
+    """Collect strategic intelligence about a company.
+
+    A failed call returns a tagged {"error", "error_class", "retryable"} dict
+    rather than empty results, so "nothing found" and "throttled" differ.
+    """
+
     try:
-        response = client.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=prompt,
-            config=config
-        )
-        return extract_json(response.text)
+        return await _generate_async(client, _company_prompt(domain, company_name), cache_ttl)
 
     except Exception as e:
-        return {
-            "error": str(e),
-            "strategic_statements": [],
-            "company_priorities": [],
-            "key_executives": [],
-            "ownership_changes": [],
-            "company_context": "",
-            "collection_notes": f"API error: {e}"
-        }
-
-
-def collect_acquirer_intel(client, acquirer_name: str, acquirer_domain: str,
-                           acquired_company: str, acquisition_date: str) -> dict:
-    """Collect intelligence about an acquiring company."""
+        return error_info(e)
 
-    prompt = ACQUIRER_PROMPT.format(
+
+def _acquirer_prompt(acquirer_name: str, acquirer_domain: str,
+                     acquired_company: str, acquisition_date: str) -> str:
+    return ACQUIRER_PROMPT.format(
         acquirer_name=acquirer_name,
         acquirer_domain=acquirer_domain or "unknown",
         acquired_company=acquired_company,
         acquisition_date=acquisition_date or "unknown date"
     )
 
-    config = types.GenerateContentConfig(
-        tools=[types.Tool(google_search=types.GoogleSearch())],
-        temperature=0.2,
-    )
 
+async def collect_acquirer_intel_async(client, acquirer_name: str, acquirer_domain: str,
+                                       acquired_company: str, acquisition_date: str,
+                                       cache_ttl: Optional[int] = None) -> dict:
+    """Collect intelligence about an acquiring company."""
+
+    prompt = _acquirer_prompt(acquirer_name, acquirer_domain, acquired_company, acquisition_date)
     try:
-        response = client.models.generate_content(
-            model=GEMINI_MODEL,
-            contents=prompt,
-            config=config
-        )
-        return extract_json(response.text)
+        return await _generate_async(client, prompt, cache_ttl)
 
     except Exception as e:
-        return {"error": str(e)}
+        return error_info(e)
 
 
-def process_acquisitions(client, intel: dict, company_name: str) -> Optional[dict]:
-    """Detect acquisitions and collect acquirer intelligence."""
+def _primary_acquisition(intel: dict) -> Optional[dict]:
+    """Return the first acquisition-type ownership change, if any."""
 
-    ownership_changes = intel.get("ownership_changes", [])
-    if not ownership_changes:
-        return None
-
-    # Find acquisitions
     acquisitions = [
-        oc for oc in ownership_changes
+        oc for oc in intel.get("ownership_changes") or ()
         if oc.get("event_type") in ["acquisition", "merger", "pe_investment"]
     ]
+    return acquisitions[0] if acquisitions else None
+
+
+def _announce_acquisition(company_name: str, acquirer_name: str, primary: dict) -> None:
+    print(f"\n[ACQUISITION DETECTED] {company_name} acquired by {acquirer_name}")
+    print(f"    Date: {primary.get('date', 'Unknown')}")
+    print(f"    Running secondary collection on acquirer...")
+
+
+def _acquisition_info(primary: dict, acquirer_name: str, acquirer_intel: dict) -> dict:
+    return {
+        "detected": True,
+        "acquirer_name": acquirer_name,
+        "acquirer_domain": primary.get("counterparty_domain"),
+        "acquisition_date": primary.get("date"),
+        "details": primary.get("details"),
+        "acquirer_intel": acquirer_intel
+    }
 
-    if not acquisitions:
+
+async def process_acquisitions_async(client, intel: dict, company_name: str,
+                                     cache_ttl: Optional[int] = None, quiet: bool = False) -> Optional[dict]:
+    """Detect acquisitions and collect acquirer intelligence."""
+
+    primary = _primary_acquisition(intel)
+    if primary is None:
         return None
 
-    primary = acquisitions[0]
     acquirer_name = primary.get("counterparty_name", "")
 
     if not acquirer_name:
         return {"detected": True, "acquirer_intel": None, "note": "Acquirer name not found"}
 
-    print(f"\n[ACQUISITION DETECTED] {company_name} acquired by {acquirer_name}")
-    print(f"    Date: {primary.get('date', 'Unknown')}")
-    print(f"    Running secondary collection on acquirer...")
+    if not quiet:
+        _announce_acquisition(company_name, acquirer_name, primary)
 
-    acquirer_intel = collect_acquirer_intel(
+    acquirer_intel = await collect_acquirer_intel_async(
         client=client,
         acquirer_name=acquirer_name,
         acquirer_domain=primary.get("counterparty_domain", ""),
         acquired_company=company_name,
-        acquisition_date=primary.get("date", "")
+        acquisition_date=primary.get("date", ""),
+        cache_ttl=cache_ttl
     )
 
-    return {
-        "detected": True,
-        "acquirer_name": acquirer_name,
-        "acquirer_domain": primary.get("counterparty_domain"),
-        "acquisition_date": primary.get("date"),
-        "details": primary.get("details"),
-        "acquirer_intel": acquirer_intel
+    return _acquisition_info(primary, acquirer_name, acquirer_intel)
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+async def collect_intel_async(client, domain: str, company_name: str, include_acquirer: bool = True,
+                              include_revenue: bool = False, quiet: bool = False,
+                              cache_ttl: Optional[int] = None) -> dict:
+    """Collect company intel, acquirer intel and (optionally) revenue for one domain.
+
+    Revenue research doesn't depend on the intel results, so it starts as a
+    task up front and overlaps the company/acquirer calls.
+    """
+
+    start_time = time.time()
+
+    # Collect company intelligence
+    if not quiet:
+        print(f"\n[1/2] Collecting company intelligence...")
+
+    revenue_task = None
+    if include_revenue:
+        revenue_task = asyncio.create_task(research_revenue_async(client, domain, company_name, cache_ttl))
+
+    # Don't leave the revenue task running if anything below raises
+    try:
+        intel = await collect_company_intel_async(client, domain, company_name, cache_ttl)
+
+        if "error" in intel:
+            if not quiet:
+                print(f"    Collection failed ({intel.get('error_class')}): {intel['error']}")
+        elif not quiet:
+            print(f"    Found {len(intel.get('strategic_statements', []))} strategic statements")
+            print(f"    Found {len(intel.get('key_executives', []))} executives")
+
+        # Check for acquisitions (nothing to check if the company call failed)
+        if include_acquirer and "error" not in intel:
+            if not quiet:
+                print(f"\n[2/2] Checking for acquisitions...")
+            acquisition_info = await process_acquisitions_async(client, intel, company_name, cache_ttl, quiet)
+
+            if acquisition_info and acquisition_info.get("detected"):
+                intel["acquisition_info"] = acquisition_info
+                if not quiet and acquisition_info.get("acquirer_intel"):
+                    acq = acquisition_info["acquirer_intel"]
+                    print(f"    Acquirer executives: {len(acq.get('key_executives', []))}")
+                    print(f"    Other acquisitions: {len(acq.get('other_acquisitions', []))}")
+            elif not quiet:
+                print(f"    No acquisitions detected")
+    except BaseException:
+        if revenue_task is not None:
+            revenue_task.cancel()
+        raise
+
+    # Collect revenue estimate (started alongside the company intel call)
+    if revenue_task is not None:
+        try:
+            revenue = await revenue_task
+            revenue["confidence"] = calculate_confidence(revenue)
+        except Exception as e:
+            revenue = error_info(e)
+        intel["revenue"] = revenue
+        if not quiet:
+            print(f"\n    Revenue estimates: {len(revenue.get('revenue_estimates', []))}"
+                  f" (confidence: {revenue.get('confidence', 'N/A')})")
+
+    # Add metadata
+    intel["_metadata"] = {
+        "collected_at": datetime.now().isoformat(),
+        "domain": domain,
+        "company_name": company_name,
+        "collection_time_seconds": round(time.time() - start_time, 1)
     }
 
+    return intel
+
+
+async def run_batch(client, domains: List[str], concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+                    include_acquirer: bool = True, include_revenue: bool = False,
+                    quiet: bool = False, cache_ttl: Optional[int] = None,
+                    output_dir: Optional[str] = None, fmt: str = "json") -> List[dict]:
+    """Collect intel for many domains concurrently, sharing one client.
+
+    At most `concurrency` domains are in flight at once, to stay under the
+    Gemini RPM limit. Results come back in the same order as domains; a domain
+    whose collection failed gets a tagged {"error": ...} entry instead.
+
+    Domains that failed with a retryable error (throttling, server errors) are
+    re-collected after BATCH_RETRY_DELAY_SECONDS, up to BATCH_RETRY_ROUNDS
+    times, without holding a concurrency slot while they wait.
+
+    With output_dir, each domain's reports are written as soon as it finishes,
+    on a worker thread so the disk I/O overlaps the other domains' API calls.
+    A write that fails is recorded as "write_error" on that domain's entry.
+    """
+
+    sem = asyncio.Semaphore(concurrency)
+    done = 0
+
+    async def _collect(domain: str) -> dict:
+        try:
+            async with sem:
+                return await collect_intel_async(
+                    client, domain, infer_company_name(domain),
+                    include_acquirer=include_acquirer, include_revenue=include_revenue, quiet=True,
+                    cache_ttl=cache_ttl
+                )
+        except Exception as e:
+            intel = error_info(e)
+            intel["_metadata"] = {"domain": domain, "company_name": infer_company_name(domain),
+                                  "collection_time_seconds": 0}
+            return intel
+
+    async def _one(domain: str) -> dict:
+        nonlocal done
+        intel = await _collect(domain)
+        for _ in range(BATCH_RETRY_ROUNDS):
+            if not intel.get("retryable"):
+                break
+            if not quiet:
+                print(f"    {domain}: {intel.get('error_class')}, retrying in {BATCH_RETRY_DELAY_SECONDS}s")
+            await asyncio.sleep(BATCH_RETRY_DELAY_SECONDS)
+            intel = await _collect(domain)
+
+        # A failed write is recorded on this domain rather than aborting the batch
+        if output_dir:
+            try:
+                await to_thread(write_outputs, os.path.join(output_dir, domain_filename(domain)), intel,
+                                lambda w: format_text(intel, w), fmt, True)
+            except Exception as e:
+                intel["write_error"] = str(e)
+                print(f"    {domain}: could not write report: {e}", file=sys.stderr)
+
+        done += 1
+        if not quiet:
+            outcome = (f"failed ({intel.get('error_class')})" if "error" in intel
+                       else f"{len(intel.get('strategic_statements', []))} statements")
+            print(f"    [{done}/{len(domains)}] {domain}: {outcome}")
+        return intel
+
+    return list(await asyncio.gather(*[_one(d) for d in domains]))
+
+
+def load_domains(filepath: str) -> List[str]:
+    """Read one domain per line, skipping blanks, # comments and duplicates."""
+
+    with open(filepath, "r") as f:
+        domains = [normalize_domain(line.strip()) for line in f
+                   if line.strip() and not line.lstrip().startswith("#")]
+    return list(dict.fromkeys(domains))
+
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+
+def format_text(intel: dict, w: Optional[Callable[[str], Any]] = None) -> Optional[str]:
+    """Format intelligence as readable text.
+
+    Returns the report as a string, or streams it through w (e.g. an open
+    file's write) and returns None.
+    """
+
+    metadata = intel.get("_metadata") or {}
+    domain = metadata.get("domain", "")
+    elapsed = metadata.get("collection_time_seconds", 0)
+
+    context = intel.get("company_context")
+    execs = intel.get("key_executives") or ()
+    priorities = intel.get("company_priorities") or ()
+    changes = intel.get("ownership_changes") or ()
+    acq_info = intel.get("acquisition_info")
+    revenue = intel.get("revenue")
+    statements = intel.get("strategic_statements") or ()
+
+    buf = None
+    if w is None:
+        buf = io.StringIO()
+        w = buf.write
+
+    w(f"{'='*70}\n")
+    w(f"COMPANY INTELLIGENCE REPORT: {intel.get('company_name', domain)}\n")
+    w(f"Domain: {domain}\n")
+    w(f"Collected: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    w(f"{'='*70}\n")
+
+    # Company Context
+    if context:
+        w(f"\n## COMPANY OVERVIEW\n\n")
+        w(context + "\n")
+
+    # Key Executives
+    if execs:
+        w(f"\n## KEY EXECUTIVES ({len(execs)})\n\n")
+        for ex in execs:
+            w(f"  • {ex.get('name', 'Unknown')} — {ex.get('title', 'Unknown title')}\n")
+            if ex.get("notable_quote"):
+                w(f"    \"{ex['notable_quote'][:100]}...\"\n")
+
+    # Company Priorities
+    if priorities:
+        w(f"\n## STRATEGIC PRIORITIES ({len(priorities)})\n\n")
+        for i, p in enumerate(priorities, 1):
+            w(f"  {i}. {p}\n")
+
+    # Ownership Changes
+    if changes:
+        w(f"\n## OWNERSHIP CHANGES ({len(changes)})\n\n")
+        for ch in changes:
+            date = ch.get("date", "Unknown date")
+            event = ch.get("event_type", "unknown").replace("_", " ").title()
+            counterparty = ch.get("counterparty_name", "Unknown")
+            w(f"  • [{date}] {event}: {counterparty}\n")
+            if ch.get("details"):
+                w(f"    {ch['details'][:100]}\n")
+
+    # Acquirer Intelligence
+    if acq_info and acq_info.get("acquirer_intel"):
+        acq = acq_info["acquirer_intel"]
+        w(f"\n## ACQUIRER INTELLIGENCE: {acq_info.get('acquirer_name')}\n\n")
+
+        if acq.get("acquisition_philosophy"):
+            w(f"  Philosophy: {acq['acquisition_philosophy'][:150]}...\n")
+
+        other_acq = acq.get("other_acquisitions") or ()
+        if other_acq:
+            w(f"\n  Other acquisitions by this company ({len(other_acq)}):\n")
+            for oa in other_acq[:5]:
+                w(f"    • {oa.get('company', 'Unknown')} ({oa.get('date', 'Unknown')})\n")
+
+        acq_execs = acq.get("key_executives") or ()
+        if acq_execs:
+            w(f"\n  Acquirer executives:\n")
+            for ex in acq_execs[:3]:
+                w(f"    • {ex.get('name', 'Unknown')} — {ex.get('title', '')}\n")
+
+    # Revenue Estimate
+    if revenue and revenue.get("revenue_estimates"):
+        best = max(revenue["revenue_estimates"], key=lambda x: x.get("credibility_score", 0))
+        w(f"\n## REVENUE ESTIMATE\n\n")
+        w(f"  {best.get('amount_display', 'N/A')} — {best.get('source_name', 'Unknown')}"
+          f" (confidence: {revenue.get('confidence', 'N/A')})\n")
+
+    # Strategic Statements
+    if statements:
+        w(f"\n## STRATEGIC STATEMENTS ({len(statements)})\n\n")
+        top_stmts = heapq.nlargest(10, statements, key=lambda x: x.get("outreach_relevance", 0))
+        for i, st in enumerate(top_stmts, 1):
+            speaker = st.get("speaker") or "Unknown"
+            title = st.get("speaker_title") or ""
+            source = st.get("source_name", "Unknown source")
+            stype = st.get("source_type", "")
+            relevance = st.get("outreach_relevance", 0)
+
+            w(f"  [{i}] Relevance: {relevance}/100 | Source: {source} ({stype})\n")
+            if speaker != "Unknown":
+                w(f"      Speaker: {speaker}, {title}\n")
+            w(f"      \"{st.get('statement', '')[:200]}\"\n")
+            if st.get("outreach_angle"):
+                w(f"      → Outreach angle: {st['outreach_angle'][:100]}\n")
+            w("\n")
+
+    # Footer
+    w(f"{'='*70}\n")
+    w(f"Collection completed in {elapsed:.1f} seconds\n")
+    w(f"{'='*70}")
+
+    return buf.getvalue() if buf is not None else None
+
 
 # =============================================================================
 # MAIN
@@ -318,196 +661,95 @@ def main():
     parser = argparse.ArgumentParser(
         description="Collect strategic intelligence about a company using Gemini + Google Search"
     )
-    parser.add_argument("--domain", required=True, help="Company domain (e.g., example.com)")
-    parser.add_argument("--company-name", help="Company name (inferred from domain if not provided)")
-    parser.add_argument("--output", "-o", help="Output file (extension determines format, or use --format)")
-    parser.add_argument("--format", "-f", choices=["json", "text", "both"], default="json", help="Output format")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--domain", help="Company domain (e.g., example.com)")
+    target.add_argument("--domains-file", help="File with one domain per line; collects all of them concurrently")
     parser.add_argument("--no-acquirer", action="store_true", help="Skip acquirer intelligence collection")
-    parser.add_argument("--quiet", "-q", action="store_true", help="Minimal output")
+    parser.add_argument("--with-revenue", action="store_true",
+                        help="Also estimate revenue (runs concurrently with intelligence collection)")
+    parser.add_argument("--concurrency", "-c", type=int, default=DEFAULT_BATCH_CONCURRENCY,
+                        help=f"Domains collected at once with --domains-file (default: {DEFAULT_BATCH_CONCURRENCY})")
+
+    args = parse_common_args(
+        parser, CACHE_TTL_SECONDS,
+        output_help="Output file (extension determines format, or use --format); a directory with --domains-file"
+    )
+
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    return asyncio.run(amain(args))
 
-    args = parser.parse_args()
 
-    # Normalize domain
-    domain = args.domain.lower()
-    domain = domain.replace("https://", "").replace("http://", "").replace("www.", "").rstrip("/")
-    company_name = args.company_name or domain.split(".")[0].title()
+async def amain(args) -> int:
+    """Run discovery for parsed CLI args."""
+
+    if args.domains_file:
+        return await batch_main(args)
+
+    domain = normalize_domain(args.domain)
+    company_name = args.company_name or infer_company_name(domain)
 
     if not args.quiet:
         print(f"\n{'='*60}")
         print(f"Company Intelligence Discovery — {domain}")
         print(f"{'='*60}")
 
-    start_time = time.time()
+    client = create_client()
+    intel = await collect_intel_async(
+        client, domain, company_name,
+        include_acquirer=not args.no_acquirer, include_revenue=args.with_revenue, quiet=args.quiet,
+        cache_ttl=args.cache_ttl
+    )
 
-    # Collect company intelligence
-    if not args.quiet:
-        print(f"\n[1/2] Collecting company intelligence...")
+    write_outputs(output_base(args.output) if args.output else None, intel,
+                  lambda w: format_text(intel, w), args.format, args.quiet)
+    return 0
 
-    client = create_client()
-    intel = collect_company_intel(client, domain, company_name)
 
-    statement_count = len(intel.get("strategic_statements", []))
-    exec_count = len(intel.get("key_executives", []))
+async def batch_main(args) -> int:
+    """Collect every domain in --domains-file; one report per domain."""
 
-    if not args.quiet:
-        print(f"    Found {statement_count} strategic statements")
-        print(f"    Found {exec_count} executives")
+    try:
+        domains = load_domains(args.domains_file)
+    except OSError as e:
+        print(f"Error reading domains file: {e}")
+        return 1
 
-    # Check for acquisitions
-    acquisition_info = None
-    if not args.no_acquirer:
-        if not args.quiet:
-            print(f"\n[2/2] Checking for acquisitions...")
-        acquisition_info = process_acquisitions(client, intel, company_name)
-
-        if acquisition_info and acquisition_info.get("detected"):
-            intel["acquisition_info"] = acquisition_info
-            if not args.quiet and acquisition_info.get("acquirer_intel"):
-                acq = acquisition_info["acquirer_intel"]
-                print(f"    Acquirer executives: {len(acq.get('key_executives', []))}")
-                print(f"    Other acquisitions: {len(acq.get('other_acquisitions', []))}")
-        elif not args.quiet:
-            print(f"    No acquisitions detected")
+    if not domains:
+        print(f"No domains found in {args.domains_file}")
+        return 1
 
-    # Add metadata
-    intel["_metadata"] = {
-        "collected_at": datetime.now().isoformat(),
-        "domain": domain,
-        "company_name": company_name,
-        "collection_time_seconds": round(time.time() - start_time, 1)
-    }
+    if not args.quiet:
+        print(f"\n{'='*60}")
+        print(f"Company Intelligence Discovery — {len(domains)} domains "
+              f"(concurrency {args.concurrency})")
+        print(f"{'='*60}\n")
+
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
 
-    # Format output
-    elapsed = time.time() - start_time
-
-    def format_text(intel: dict) -> str:
-        """Format intelligence as readable text."""
-        lines = []
-        lines.append(f"{'='*70}")
-        lines.append(f"COMPANY INTELLIGENCE REPORT: {intel.get('company_name', domain)}")
-        lines.append(f"Domain: {domain}")
-        lines.append(f"Collected: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"{'='*70}")
-
-        # Company Context
-        if intel.get("company_context"):
-            lines.append(f"\n## COMPANY OVERVIEW\n")
-            lines.append(intel["company_context"])
-
-        # Key Executives
-        execs = intel.get("key_executives", [])
-        if execs:
-            lines.append(f"\n## KEY EXECUTIVES ({len(execs)})\n")
-            for ex in execs:
-                lines.append(f"  • {ex.get('name', 'Unknown')} — {ex.get('title', 'Unknown title')}")
-                if ex.get("notable_quote"):
-                    lines.append(f"    \"{ex['notable_quote'][:100]}...\"")
-
-        # Company Priorities
-        priorities = intel.get("company_priorities", [])
-        if priorities:
-            lines.append(f"\n## STRATEGIC PRIORITIES ({len(priorities)})\n")
-            for i, p in enumerate(priorities, 1):
-                lines.append(f"  {i}. {p}")
-
-        # Ownership Changes
-        changes = intel.get("ownership_changes", [])
-        if changes:
-            lines.append(f"\n## OWNERSHIP CHANGES ({len(changes)})\n")
-            for ch in changes:
-                date = ch.get("date", "Unknown date")
-                event = ch.get("event_type", "unknown").replace("_", " ").title()
-                counterparty = ch.get("counterparty_name", "Unknown")
-                lines.append(f"  • [{date}] {event}: {counterparty}")
-                if ch.get("details"):
-                    lines.append(f"    {ch['details'][:100]}")
-
-        # Acquirer Intelligence
-        acq_info = intel.get("acquisition_info")
-        if acq_info and acq_info.get("acquirer_intel"):
-            acq = acq_info["acquirer_intel"]
-            lines.append(f"\n## ACQUIRER INTELLIGENCE: {acq_info.get('acquirer_name')}\n")
-
-            if acq.get("acquisition_philosophy"):
-                lines.append(f"  Philosophy: {acq['acquisition_philosophy'][:150]}...")
-
-            other_acq = acq.get("other_acquisitions", [])
-            if other_acq:
-                lines.append(f"\n  Other acquisitions by this company ({len(other_acq)}):")
-                for oa in other_acq[:5]:
-                    lines.append(f"    • {oa.get('company', 'Unknown')} ({oa.get('date', 'Unknown')})")
-
-            acq_execs = acq.get("key_executives", [])
-            if acq_execs:
-                lines.append(f"\n  Acquirer executives:")
-                for ex in acq_execs[:3]:
-                    lines.append(f"    • {ex.get('name', 'Unknown')} — {ex.get('title', '')}")
-
-        # Strategic Statements
-        statements = intel.get("strategic_statements", [])
-        if statements:
-            lines.append(f"\n## STRATEGIC STATEMENTS ({len(statements)})\n")
-            sorted_stmts = sorted(statements, key=lambda x: x.get("outreach_relevance", 0), reverse=True)
-            for i, st in enumerate(sorted_stmts[:10], 1):
-                speaker = st.get("speaker") or "Unknown"
-                title = st.get("speaker_title") or ""
-                source = st.get("source_name", "Unknown source")
-                stype = st.get("source_type", "")
-                relevance = st.get("outreach_relevance", 0)
-
-                lines.append(f"  [{i}] Relevance: {relevance}/100 | Source: {source} ({stype})")
-                if speaker != "Unknown":
-                    lines.append(f"      Speaker: {speaker}, {title}")
-                lines.append(f"      \"{st.get('statement', '')[:200]}\"")
-                if st.get("outreach_angle"):
-                    lines.append(f"      → Outreach angle: {st['outreach_angle'][:100]}")
-                lines.append("")
-
-        # Footer
-        lines.append(f"{'='*70}")
-        lines.append(f"Collection completed in {elapsed:.1f} seconds")
-        lines.append(f"{'='*70}")
-
-        return "\n".join(lines)
-
-    # Output based on format
-    text_output = format_text(intel)
-    json_output = json.dumps(intel, indent=2)
+    client = create_client()
+    results = await run_batch(
+        client, domains, args.concurrency,
+        include_acquirer=not args.no_acquirer, include_revenue=args.with_revenue, quiet=args.quiet,
+        cache_ttl=args.cache_ttl,
+        output_dir=args.output, fmt=args.format
+    )
 
     if args.output:
-        base_name = args.output.rsplit(".", 1)[0] if "." in args.output else args.output
-
-        if args.format == "json":
-            with open(f"{base_name}.json", "w") as f:
-                f.write(json_output)
-            if not args.quiet:
-                print(f"\n✅ JSON saved to {base_name}.json")
-
-        elif args.format == "text":
-            with open(f"{base_name}.txt", "w") as f:
-                f.write(text_output)
-            if not args.quiet:
-                print(f"\n✅ Text saved to {base_name}.txt")
-
-        elif args.format == "both":
-            with open(f"{base_name}.json", "w") as f:
-                f.write(json_output)
-            with open(f"{base_name}.txt", "w") as f:
-                f.write(text_output)
-            if not args.quiet:
-                print(f"\n✅ Saved to {base_name}.json and {base_name}.txt")
-
-    else:
-        # Print to stdout
-        if args.format == "json":
-            print(json_output)
-        elif args.format == "text":
-            print(text_output)
-        elif args.format == "both":
-            print(text_output)
-            print("\n--- JSON ---\n")
-            print(json_output)
+        unsaved = [r for r in results if "write_error" in r]
+        if not args.quiet:
+            print(f"\n✅ Saved {len(results) - len(unsaved)} reports to {args.output}/")
+        return 1 if unsaved else 0
+
+    def render_all(w):
+        for i, intel in enumerate(results):
+            if i:
+                w("\n\n")
+            format_text(intel, w)
 
+    write_outputs(None, results, render_all, args.format)
     return 0
 
 
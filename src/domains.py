@@ -0,0 +1,33 @@
+"""
+Domain Helpers
+
+Shared normalization for user-supplied company domains, so the CLIs and
+any batch driver importing them agree on what "the same domain" means
+(and therefore share cache entries and output file names).
+
+License: MIT
+"""
+
+import re
+
+
+# Leading scheme and www. in one pass; only stripped at the start of the string
+_DOMAIN_PREFIX_RE = re.compile(r'^(?:https?://)?(?:www\.)?')
+
+# Anything that can't appear in a portable file name (path separators, ports, queries)
+_UNSAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9._-]')
+
+
+def normalize_domain(raw: str) -> str:
+    """Strip scheme, www. and trailing slash from a user-supplied domain."""
+    return _DOMAIN_PREFIX_RE.sub("", raw.strip().lower(), count=1).rstrip("/")
+
+
+def domain_filename(domain: str) -> str:
+    """File-name-safe form of a normalized domain (b.com/about -> b.com_about)."""
+    return _UNSAFE_FILENAME_RE.sub("_", domain)
+
+
+def infer_company_name(domain: str) -> str:
+    """Best-effort company name from a domain (example.com -> Example)."""
+    return domain.split(".")[0].title()
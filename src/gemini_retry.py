@@ -0,0 +1,97 @@
+"""
+Gemini Retry
+
+Exponential backoff with jitter around Gemini calls, so a transient 429 or
+5xx becomes a few seconds of delay instead of a lost result.
+
+Usage:
+    response = call_with_retry(lambda: client.models.generate_content(...))
+    response = await call_with_retry_async(lambda: client.aio.models.generate_content(...))
+
+License: MIT
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import httpx
+from google.genai import errors
+
+
+T = TypeVar("T")
+
+# Rate limited, internal error, unavailable, gateway timeout
+RETRYABLE_STATUS_CODES = {429, 500, 503, 504}
+
+MAX_ATTEMPTS = 5
+BASE_DELAY_SECONDS = 1.0
+MAX_DELAY_SECONDS = 30.0
+JITTER_FACTOR = 0.25
+
+
+def _status_code(e: BaseException) -> Optional[int]:
+    if isinstance(e, errors.APIError):
+        return e.code
+    # Anything else that carries an HTTP status (e.g. wrapped transport errors)
+    code = getattr(e, "code", None) or getattr(e, "status_code", None)
+    return code if isinstance(code, int) else None
+
+
+def is_retryable(e: BaseException) -> bool:
+    """True for rate limits, server errors and dropped connections."""
+    if isinstance(e, (httpx.TransportError, ConnectionError, TimeoutError)):
+        return True
+    return _status_code(e) in RETRYABLE_STATUS_CODES
+
+
+def error_info(e: BaseException) -> Dict[str, Any]:
+    """Tagged error result for a failed call, so callers can tell a throttled
+    request (worth retrying later) from a bad one or an empty answer."""
+    return {"error": str(e), "error_class": type(e).__name__, "retryable": is_retryable(e)}
+
+
+def _retry_after(e: BaseException) -> Optional[float]:
+    """Seconds requested by the server's Retry-After header, if any."""
+    headers = getattr(getattr(e, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_delay(attempt: int, e: BaseException, base: float = BASE_DELAY_SECONDS,
+                cap: float = MAX_DELAY_SECONDS) -> float:
+    """Delay before retry number `attempt` (0-based)."""
+    retry_after = _retry_after(e)
+    if retry_after is not None:
+        return min(cap, retry_after)
+    delay = min(cap, base * 2 ** attempt)
+    return delay * (1 + random.uniform(-JITTER_FACTOR, JITTER_FACTOR))
+
+
+def call_with_retry(fn: Callable[[], T], *, max_attempts: int = MAX_ATTEMPTS,
+                    base: float = BASE_DELAY_SECONDS, cap: float = MAX_DELAY_SECONDS) -> T:
+    """Call fn, retrying retryable errors; re-raises after the final attempt."""
+    for attempt in range(max_attempts):
+        try:
+            return fn()
+        except Exception as e:
+            if attempt == max_attempts - 1 or not is_retryable(e):
+                raise
+            time.sleep(retry_delay(attempt, e, base, cap))
+
+
+async def call_with_retry_async(fn: Callable[[], Awaitable[T]], *, max_attempts: int = MAX_ATTEMPTS,
+                                base: float = BASE_DELAY_SECONDS, cap: float = MAX_DELAY_SECONDS) -> T:
+    """Async variant of call_with_retry; fn must return a fresh awaitable per call."""
+    for attempt in range(max_attempts):
+        try:
+            return await fn()
+        except Exception as e:
+            if attempt == max_attempts - 1 or not is_retryable(e):
+                raise
+            await asyncio.sleep(retry_delay(attempt, e, base, cap))
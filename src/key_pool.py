@@ -0,0 +1,157 @@
+"""
+Gemini API Key Pool
+
+Spreads calls over several API keys so batch throughput isn't capped by a
+single project's quota. Gemini rate limits apply per Google Cloud project,
+not per key: keys from the same project share one quota and pooling them
+gains nothing. Use one key per project.
+
+A KeyPool can stand in for a genai.Client: `pool.models.generate_content(...)`
+and `pool.aio.models.generate_content(...)` pick a key per call. The key with
+the most budget left this minute wins. A key that gets a 429 cools down and
+is skipped, so the next retry goes to another key.
+
+Usage:
+    pool = KeyPool(["key-a", "key-b"])
+    client = pool.acquire()                               # explicit
+    await pool.aio.models.generate_content(model=..., contents=...)  # drop-in
+
+Environment:
+    GEMINI_API_KEYS    - Comma-separated keys (overrides GEMINI_API_KEY)
+    GEMINI_KEY_RPM     - Requests per minute allowed per key (default: untracked)
+    GEMINI_KEY_RPD     - Requests per day allowed per key (default: untracked)
+
+License: MIT
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from google import genai
+from google.genai import errors
+
+from rate_limit import env_limit
+
+
+# How long a key that hit a 429 is skipped
+COOLDOWN_SECONDS = 60.0
+
+
+def api_keys_from_env() -> List[str]:
+    """Keys from GEMINI_API_KEYS, falling back to the single GEMINI_API_KEY."""
+    raw = os.environ.get("GEMINI_API_KEYS") or os.environ.get("GEMINI_API_KEY") or ""
+    return [k.strip() for k in raw.split(",") if k.strip()]
+
+
+class _KeyState:
+    """Usage counters for one key."""
+
+    def __init__(self, client: genai.Client):
+        self.client = client
+        self.minute = 0
+        self.minute_used = 0
+        self.day = 0
+        self.day_used = 0
+        self.last_used = 0.0
+        self.cooling_until = 0.0
+
+
+class KeyPool:
+    """Pick among one genai.Client per key by remaining per-minute budget."""
+
+    def __init__(self, keys: List[str], rpm: Optional[int] = None, rpd: Optional[int] = None,
+                 client_factory: Callable[[str], genai.Client] = lambda key: genai.Client(api_key=key)):
+        if not keys:
+            raise ValueError("KeyPool needs at least one API key")
+        self.rpm = rpm
+        self.rpd = rpd
+        self._keys = [_KeyState(client_factory(k)) for k in keys]
+        self._lock = threading.Lock()
+        self.models = _PooledModels(self, aio=False)
+        self.aio = _PooledAio(self)
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "KeyPool":
+        kwargs.setdefault("rpm", env_limit("GEMINI_KEY_RPM"))
+        kwargs.setdefault("rpd", env_limit("GEMINI_KEY_RPD"))
+        return cls(api_keys_from_env(), **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _remaining(self, state: _KeyState) -> float:
+        if self.rpd is not None and state.day_used >= self.rpd:
+            return float("-inf")
+        if self.rpm is None:
+            return -state.minute_used
+        return self.rpm - state.minute_used
+
+    def acquire(self) -> genai.Client:
+        """Client for the key with the most budget left, skipping cooling keys."""
+
+        with self._lock:
+            now = time.time()
+            minute, day = int(now // 60), int(now // 86400)
+            for state in self._keys:
+                if state.minute != minute:
+                    state.minute, state.minute_used = minute, 0
+                if state.day != day:
+                    state.day, state.day_used = day, 0
+
+            ready = [s for s in self._keys if s.cooling_until <= now]
+            if ready:
+                # Most remaining budget first, then least recently used
+                state = max(ready, key=lambda s: (self._remaining(s), -s.last_used))
+            else:
+                state = min(self._keys, key=lambda s: s.cooling_until)
+
+            state.minute_used += 1
+            state.day_used += 1
+            state.last_used = now
+            return state.client
+
+    def mark_rate_limited(self, client: genai.Client, cooldown: float = COOLDOWN_SECONDS) -> None:
+        """Skip client's key for cooldown seconds after it was throttled."""
+
+        with self._lock:
+            for state in self._keys:
+                if state.client is client:
+                    state.cooling_until = time.time() + cooldown
+
+    def _note_error(self, client: genai.Client, e: Exception) -> None:
+        if isinstance(e, errors.APIError) and e.code == 429:
+            self.mark_rate_limited(client)
+
+
+class _PooledModels:
+    """client.models / client.aio.models look-alike that acquires a key per call."""
+
+    def __init__(self, pool: KeyPool, aio: bool):
+        self._pool = pool
+        self._aio = aio
+
+    def generate_content(self, **kwargs) -> Any:
+        if self._aio:
+            return self._generate_content_async(**kwargs)
+
+        client = self._pool.acquire()
+        try:
+            return client.models.generate_content(**kwargs)
+        except Exception as e:
+            self._pool._note_error(client, e)
+            raise
+
+    async def _generate_content_async(self, **kwargs) -> Any:
+        client = self._pool.acquire()
+        try:
+            return await client.aio.models.generate_content(**kwargs)
+        except Exception as e:
+            self._pool._note_error(client, e)
+            raise
+
+
+class _PooledAio:
+    def __init__(self, pool: KeyPool):
+        self.models = _PooledModels(pool, aio=True)
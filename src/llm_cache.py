@@ -0,0 +1,80 @@
+"""
+Gemini Response Cache
+
+Persistent on-disk cache for Gemini results, so re-running a pipeline on the
+same inputs skips API calls that have already been paid for.
+
+Each entry is a small JSON file named by its key that records its own expiry.
+Keys should cover everything that affects the response (model, prompt, URL)
+so that editing a prompt invalidates old entries automatically.
+
+Environment:
+    GEMINI_INTEL_CACHE_DIR - Cache location (default: ~/.cache/gemini-intel)
+
+License: MIT
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+
+CACHE_DIR = Path(os.environ.get("GEMINI_INTEL_CACHE_DIR", "~/.cache/gemini-intel")).expanduser()
+
+
+def make_key(*parts: str) -> str:
+    """Build a cache key from the inputs that determine a response."""
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return CACHE_DIR / f"{key}.json"
+
+
+def cache_get(key: str) -> Optional[Any]:
+    """Return the cached value for key, or None if missing or expired."""
+
+    path = _entry_path(key)
+    try:
+        with open(path, "r") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if entry.get("expires_at", 0) < time.time():
+        try:
+            path.unlink()
+        except OSError:
+            pass
+        return None
+
+    return entry.get("value")
+
+
+def cache_put(key: str, value: Any, ttl_seconds: int) -> None:
+    """Store a JSON-serializable value under key for ttl_seconds.
+
+    Writes go through a temp file and rename so concurrent readers never see
+    a partial entry. Failures are ignored; the cache is best-effort.
+    """
+
+    entry = {"expires_at": time.time() + ttl_seconds, "value": value}
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, _entry_path(key))
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
@@ -0,0 +1,134 @@
+"""
+Gemini Rate Limiting
+
+Client-side token buckets that pace Gemini calls under the account's
+requests-per-minute (RPM) and tokens-per-minute (TPM) quotas. Batch runs
+then wait a few hundred milliseconds before a call instead of bursting
+into 429s and paying the retry backoff.
+
+The buckets are process-wide, so discovery and revenue calls made from
+the same process share one budget. Both are disabled until a limit is set.
+
+Usage:
+    configure_rate_limits(rpm=150, tpm=1_000_000)
+    await throttle(estimate_tokens(prompt))   # async callers
+    throttle_sync(estimate_tokens(prompt))    # sync callers
+
+    # Charge every retry attempt, not just the first
+    call_with_retry_async(throttled(lambda: client.aio.models.generate_content(...), tokens))
+    call_with_retry(throttled_sync(lambda: client.models.generate_content(...), tokens))
+
+Environment:
+    GEMINI_RPM - Requests per minute (default: unlimited)
+    GEMINI_TPM - Tokens per minute (default: unlimited)
+
+License: MIT
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+
+T = TypeVar("T")
+
+
+def env_limit(name: str) -> Optional[int]:
+    """Integer limit from environment variable name, or None when unset."""
+    value = os.environ.get(name)
+    return int(value) if value else None
+
+
+DEFAULT_RPM = env_limit("GEMINI_RPM")
+DEFAULT_TPM = env_limit("GEMINI_TPM")
+
+# Response tokens budgeted per call on top of the prompt estimate
+OUTPUT_TOKEN_ALLOWANCE = 2048
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at rate_per_sec, holding at most burst.
+
+    Acquiring more tokens than are available reserves them anyway (the
+    balance goes negative) and returns the wait, so concurrent callers
+    queue up behind each other instead of polling.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: float):
+        self.rate = rate_per_sec
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens and return how long the caller must wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+            return max(0.0, -self.tokens / self.rate)
+
+    async def acquire(self, tokens: float = 1) -> None:
+        wait = self._reserve(tokens)
+        if wait:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self, tokens: float = 1) -> None:
+        wait = self._reserve(tokens)
+        if wait:
+            time.sleep(wait)
+
+
+_RPM_BUCKET: Optional[TokenBucket] = None
+_TPM_BUCKET: Optional[TokenBucket] = None
+
+
+def configure_rate_limits(rpm: Optional[int] = None, tpm: Optional[int] = None) -> None:
+    """Set the process-wide limits; None (or 0) disables a bucket."""
+    global _RPM_BUCKET, _TPM_BUCKET
+    _RPM_BUCKET = TokenBucket(rate_per_sec=rpm / 60, burst=rpm) if rpm else None
+    _TPM_BUCKET = TokenBucket(rate_per_sec=tpm / 60, burst=tpm) if tpm else None
+
+
+def estimate_tokens(prompt: str) -> int:
+    """Rough token cost of one call: ~4 characters per prompt token plus the output allowance."""
+    return len(prompt) // 4 + OUTPUT_TOKEN_ALLOWANCE
+
+
+async def throttle(estimated_tokens: int) -> None:
+    """Wait until one request and estimated_tokens fit under the configured limits."""
+    if _RPM_BUCKET is not None:
+        await _RPM_BUCKET.acquire(1)
+    if _TPM_BUCKET is not None:
+        await _TPM_BUCKET.acquire(estimated_tokens)
+
+
+def throttle_sync(estimated_tokens: int) -> None:
+    """Blocking variant of throttle for sync callers."""
+    if _RPM_BUCKET is not None:
+        _RPM_BUCKET.acquire_sync(1)
+    if _TPM_BUCKET is not None:
+        _TPM_BUCKET.acquire_sync(estimated_tokens)
+
+
+def throttled(fn: Callable[[], Awaitable[T]], estimated_tokens: int) -> Callable[[], Awaitable[T]]:
+    """Wrap an async call so each invocation (e.g. each retry) waits on throttle first."""
+    async def _call() -> T:
+        await throttle(estimated_tokens)
+        return await fn()
+    return _call
+
+
+def throttled_sync(fn: Callable[[], T], estimated_tokens: int) -> Callable[[], T]:
+    """Blocking variant of throttled."""
+    def _call() -> T:
+        throttle_sync(estimated_tokens)
+        return fn()
+    return _call
+
+
+configure_rate_limits(DEFAULT_RPM, DEFAULT_TPM)
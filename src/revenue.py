@@ -19,35 +19,53 @@ Requirements:
 
 Environment:
     GEMINI_API_KEY - Your Google AI Studio API key
+    GEMINI_API_KEYS - Optional comma-separated keys from different projects;
+                      calls are spread across them (see key_pool.py)
 
 Author: Built with Claude Code
 License: MIT
 """
 
-import os
+import io
 import sys
 import json
+import math
 import argparse
 import re
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Optional, Union
 
 from google import genai
 from google.genai import types
 
+from cli_common import (infer_company_name, json_loads, normalize_domain, output_base,
+                        parse_common_args, write_outputs)
+from gemini_retry import call_with_retry, call_with_retry_async
+from key_pool import KeyPool, api_keys_from_env
+from llm_cache import cache_get, cache_put, make_key
+from rate_limit import estimate_tokens, throttled, throttled_sync
+
 
 # =============================================================================
 # Configuration
 # =============================================================================
 
-GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
-if not GEMINI_API_KEY:
+GEMINI_API_KEYS = api_keys_from_env()
+if not GEMINI_API_KEYS:
     print("Error: GEMINI_API_KEY environment variable not set")
     print("Get your API key at: https://aistudio.google.com/app/apikey")
     sys.exit(1)
+GEMINI_API_KEY = GEMINI_API_KEYS[0]
 
 GEMINI_MODEL = "gemini-2.0-flash"
 
+# How long Gemini responses stay in the on-disk cache
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# JSON extraction patterns used by extract_json (fenced code block, then bare object)
+_CODEBLOCK_RE = re.compile(r'```(?:json)?\s*(\{[\s\S]*?\})\s*```')
+_RAWJSON_RE = re.compile(r'\{[\s\S]*\}')
+
 SYSTEM_PROMPT = """You are a financial research analyst specializing in private company revenue estimation.
 
 TASK: Research annual revenue for the company I provide. Use Google Search to find current data.
@@ -126,32 +144,38 @@ Return ONLY the JSON object, nothing else.
 # Gemini Client
 # =============================================================================
 
-def create_client() -> genai.Client:
-    """Create Gemini API client."""
-    return genai.Client(api_key=GEMINI_API_KEY)
+_CLIENT = None
+
+
+def create_client() -> Union[genai.Client, KeyPool]:
+    """Return the shared Gemini API client (a KeyPool with several keys), creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = KeyPool.from_env() if len(GEMINI_API_KEYS) > 1 else genai.Client(api_key=GEMINI_API_KEY)
+    return _CLIENT
 
 
 def extract_json(text: str) -> Dict[str, Any]:
     """Extract JSON from Gemini response."""
-    # Try direct parse
+    # Try direct parse (orjson.JSONDecodeError subclasses json.JSONDecodeError)
     try:
-        return json.loads(text)
+        return json_loads(text)
     except json.JSONDecodeError:
         pass
 
     # Try markdown code block
-    match = re.search(r'```(?:json)?\s*(\{[\s\S]*?\})\s*```', text)
+    match = _CODEBLOCK_RE.search(text)
     if match:
         try:
-            return json.loads(match.group(1))
+            return json_loads(match.group(1))
         except json.JSONDecodeError:
             pass
 
     # Try raw JSON
-    match = re.search(r'\{[\s\S]*\}', text)
+    match = _RAWJSON_RE.search(text)
     if match:
         try:
-            return json.loads(match.group(0))
+            return json_loads(match.group(0))
         except json.JSONDecodeError:
             pass
 
@@ -164,22 +188,16 @@ def extract_json(text: str) -> Dict[str, Any]:
     }
 
 
-def research_revenue(client: genai.Client, domain: str, company_name: str) -> Dict[str, Any]:
-    """Research company revenue using Gemini with Google Search."""
-
-    user_prompt = f"Research annual revenue for: {company_name} (domain: {domain})"
-
-    response = client.models.generate_content(
-        model=GEMINI_MODEL,
-        contents=user_prompt,
-        config=types.GenerateContentConfig(
-            system_instruction=SYSTEM_PROMPT,
-            tools=[types.Tool(google_search=types.GoogleSearch())],
-            temperature=0.2
-        )
+def _revenue_config() -> types.GenerateContentConfig:
+    return types.GenerateContentConfig(
+        system_instruction=SYSTEM_PROMPT,
+        tools=[types.Tool(google_search=types.GoogleSearch())],
+        temperature=0.2
     )
 
-    result = extract_json(response.text)
+
+def _parse_revenue(text: str, domain: str, company_name: str) -> Dict[str, Any]:
+    result = extract_json(text)
 
     if "domain" not in result:
         result["domain"] = domain
@@ -189,6 +207,63 @@ def research_revenue(client: genai.Client, domain: str, company_name: str) -> Di
     return result
 
 
+def _revenue_cache_key(user_prompt: str) -> str:
+    # SYSTEM_PROMPT is part of the key so editing it invalidates old entries
+    return make_key(GEMINI_MODEL, SYSTEM_PROMPT, user_prompt)
+
+
+def research_revenue(client: genai.Client, domain: str, company_name: str,
+                     cache_ttl: Optional[int] = None) -> Dict[str, Any]:
+    """Research company revenue using Gemini with Google Search.
+
+    The raw response is cached on disk for cache_ttl seconds (None disables
+    the cache); responses that fail to parse are never cached.
+    """
+
+    user_prompt = f"Research annual revenue for: {company_name} (domain: {domain})"
+    cache_key = _revenue_cache_key(user_prompt)
+
+    if cache_ttl:
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return _parse_revenue(cached, domain, company_name)
+
+    response = call_with_retry(throttled_sync(lambda: client.models.generate_content(
+        model=GEMINI_MODEL,
+        contents=user_prompt,
+        config=_revenue_config()
+    ), estimate_tokens(SYSTEM_PROMPT + user_prompt)))
+
+    result = _parse_revenue(response.text, domain, company_name)
+    if cache_ttl and not result.get("parse_error"):
+        cache_put(cache_key, response.text, cache_ttl)
+    return result
+
+
+async def research_revenue_async(client: genai.Client, domain: str, company_name: str,
+                                 cache_ttl: Optional[int] = None) -> Dict[str, Any]:
+    """Async variant of research_revenue, for running alongside other Gemini calls."""
+
+    user_prompt = f"Research annual revenue for: {company_name} (domain: {domain})"
+    cache_key = _revenue_cache_key(user_prompt)
+
+    if cache_ttl:
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return _parse_revenue(cached, domain, company_name)
+
+    response = await call_with_retry_async(throttled(lambda: client.aio.models.generate_content(
+        model=GEMINI_MODEL,
+        contents=user_prompt,
+        config=_revenue_config()
+    ), estimate_tokens(SYSTEM_PROMPT + user_prompt)))
+
+    result = _parse_revenue(response.text, domain, company_name)
+    if cache_ttl and not result.get("parse_error"):
+        cache_put(cache_key, response.text, cache_ttl)
+    return result
+
+
 # =============================================================================
 # Confidence Scoring
 # =============================================================================
@@ -202,13 +277,27 @@ def calculate_confidence(data: Dict[str, Any]) -> str:
     if not estimates:
         return "INSUFFICIENT"
 
-    best_credibility = max(e.get("credibility_score", 0) for e in estimates)
     source_count = len(estimates)
 
+    # Best credibility and amount spread, in one pass over the estimates
+    best_credibility = 0
+    amt_min, amt_max, amt_sum, amt_n = math.inf, -math.inf, 0.0, 0
+    for e in estimates:
+        credibility = e.get("credibility_score", 0)
+        if credibility > best_credibility:
+            best_credibility = credibility
+        amount = e.get("amount_millions", 0)
+        if amount > 0:
+            if amount < amt_min:
+                amt_min = amount
+            if amount > amt_max:
+                amt_max = amount
+            amt_sum += amount
+            amt_n += 1
+
     # Calculate variance
-    amounts = [e.get("amount_millions", 0) for e in estimates if e.get("amount_millions", 0) > 0]
-    if len(amounts) >= 2:
-        variance_pct = (max(amounts) - min(amounts)) / (sum(amounts) / len(amounts)) * 100
+    if amt_n >= 2:
+        variance_pct = (amt_max - amt_min) / (amt_sum / amt_n) * 100
     else:
         variance_pct = 0
 
@@ -244,76 +333,87 @@ def calculate_confidence(data: Dict[str, Any]) -> str:
 # Output Formatting
 # =============================================================================
 
-def format_text_report(data: Dict[str, Any], confidence: str) -> str:
-    """Format results as human-readable text."""
+def format_text_report(data: Dict[str, Any], confidence: str,
+                       w: Optional[Callable[[str], Any]] = None) -> Optional[str]:
+    """Format results as human-readable text.
+
+    Returns the report as a string, or streams it through w (e.g. an open
+    file's write) and returns None.
+    """
+
+    context = data.get("company_context")
+    ownership = data.get("ownership") or {}
+    estimates = data.get("revenue_estimates") or ()
+    employee = data.get("employee_count") or {}
+    quality = data.get("research_quality") or {}
+    red_flags = quality.get("red_flags") or ()
+
+    buf = None
+    if w is None:
+        buf = io.StringIO()
+        w = buf.write
 
-    lines = []
-    lines.append("=" * 70)
-    lines.append(f"REVENUE ESTIMATE REPORT: {data.get('company_name', 'Unknown')}")
-    lines.append(f"Domain: {data.get('domain', 'Unknown')}")
-    lines.append(f"Collected: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append("=" * 70)
+    w("=" * 70 + "\n")
+    w(f"REVENUE ESTIMATE REPORT: {data.get('company_name', 'Unknown')}\n")
+    w(f"Domain: {data.get('domain', 'Unknown')}\n")
+    w(f"Collected: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    w("=" * 70 + "\n")
 
     # Company Context
-    if data.get("company_context"):
-        lines.append(f"\n## COMPANY OVERVIEW\n")
-        lines.append(data["company_context"])
+    if context:
+        w(f"\n## COMPANY OVERVIEW\n\n")
+        w(context + "\n")
 
     # Ownership
-    ownership = data.get("ownership", {})
     if ownership:
-        lines.append(f"\n## OWNERSHIP\n")
-        lines.append(f"  Type: {ownership.get('type', 'unknown').replace('_', ' ').title()}")
+        w(f"\n## OWNERSHIP\n\n")
+        w(f"  Type: {ownership.get('type', 'unknown').replace('_', ' ').title()}\n")
         if ownership.get("parent_company_name"):
-            lines.append(f"  Parent: {ownership['parent_company_name']}")
+            w(f"  Parent: {ownership['parent_company_name']}\n")
             if ownership.get("parent_ticker"):
-                lines.append(f"  Ticker: {ownership['parent_ticker']}")
+                w(f"  Ticker: {ownership['parent_ticker']}\n")
 
     # Revenue Estimates
-    estimates = data.get("revenue_estimates", [])
     if estimates:
-        lines.append(f"\n## REVENUE ESTIMATES ({len(estimates)} sources)\n")
+        w(f"\n## REVENUE ESTIMATES ({len(estimates)} sources)\n\n")
         sorted_est = sorted(estimates, key=lambda x: x.get("credibility_score", 0), reverse=True)
         for i, e in enumerate(sorted_est, 1):
-            lines.append(f"  [{i}] {e.get('amount_display', 'N/A')} — {e.get('source_name', 'Unknown')}")
-            lines.append(f"      Credibility: {e.get('credibility_score', 0)}/100 (Tier {e.get('source_tier', '?')})")
-            lines.append(f"      Year: {e.get('year', 'Unknown')}")
+            w(f"  [{i}] {e.get('amount_display', 'N/A')} — {e.get('source_name', 'Unknown')}\n")
+            w(f"      Credibility: {e.get('credibility_score', 0)}/100 (Tier {e.get('source_tier', '?')})\n")
+            w(f"      Year: {e.get('year', 'Unknown')}\n")
             if e.get("source_url"):
-                lines.append(f"      URL: {e['source_url'][:60]}...")
-            lines.append("")
+                w(f"      URL: {e['source_url'][:60]}...\n")
+            w("\n")
     else:
-        lines.append(f"\n## REVENUE ESTIMATES\n")
-        lines.append("  No reliable revenue data found")
+        w(f"\n## REVENUE ESTIMATES\n\n")
+        w("  No reliable revenue data found\n")
 
     # Employee Count
-    employee = data.get("employee_count", {})
     if employee and employee.get("count"):
-        lines.append(f"\n## EMPLOYEE COUNT\n")
-        lines.append(f"  {employee['count']} employees ({employee.get('source', 'Unknown')}, {employee.get('year', '')})")
+        w(f"\n## EMPLOYEE COUNT\n\n")
+        w(f"  {employee['count']} employees ({employee.get('source', 'Unknown')}, {employee.get('year', '')})\n")
 
     # Research Quality
-    quality = data.get("research_quality", {})
-    lines.append(f"\n## RESEARCH QUALITY\n")
-    lines.append(f"  Sources found: {quality.get('sources_found', 0)}")
-    lines.append(f"  Highest tier: {quality.get('highest_tier_found', 'N/A')}")
-    lines.append(f"  Confidence: {confidence}")
+    w(f"\n## RESEARCH QUALITY\n\n")
+    w(f"  Sources found: {quality.get('sources_found', 0)}\n")
+    w(f"  Highest tier: {quality.get('highest_tier_found', 'N/A')}\n")
+    w(f"  Confidence: {confidence}\n")
 
-    red_flags = quality.get("red_flags", [])
     if red_flags:
-        lines.append(f"  Red flags: {', '.join(red_flags)}")
+        w(f"  Red flags: {', '.join(red_flags)}\n")
 
     # Recommendation
-    lines.append(f"\n## RECOMMENDATION\n")
+    w(f"\n## RECOMMENDATION\n\n")
     if estimates:
         best = max(estimates, key=lambda x: x.get("credibility_score", 0))
-        lines.append(f"  Use {best.get('amount_display')} from {best.get('source_name')}")
-        lines.append(f"  Confidence: {confidence}")
+        w(f"  Use {best.get('amount_display')} from {best.get('source_name')}\n")
+        w(f"  Confidence: {confidence}\n")
     else:
-        lines.append(f"  No reliable data available")
+        w(f"  No reliable data available\n")
 
-    lines.append("\n" + "=" * 70)
+    w("\n" + "=" * 70)
 
-    return "\n".join(lines)
+    return buf.getvalue() if buf is not None else None
 
 
 # =============================================================================
@@ -325,15 +425,10 @@ def main():
         description="Estimate company revenue using Gemini + Google Search"
     )
     parser.add_argument("--domain", required=True, help="Company domain")
-    parser.add_argument("--company-name", help="Company name (inferred if not provided)")
-    parser.add_argument("--output", "-o", help="Output file")
-    parser.add_argument("--format", "-f", choices=["json", "text", "both"], default="json")
-    parser.add_argument("--quiet", "-q", action="store_true", help="Minimal output")
+    args = parse_common_args(parser, CACHE_TTL_SECONDS)
 
-    args = parser.parse_args()
-
-    domain = args.domain.lower().replace("https://", "").replace("http://", "").replace("www.", "").rstrip("/")
-    company_name = args.company_name or domain.split('.')[0].title()
+    domain = normalize_domain(args.domain)
+    company_name = args.company_name or infer_company_name(domain)
 
     if not args.quiet:
         print(f"\n{'='*60}")
@@ -344,7 +439,7 @@ def main():
     client = create_client()
 
     try:
-        data = research_revenue(client, domain, company_name)
+        data = research_revenue(client, domain, company_name, args.cache_ttl)
         estimates = data.get("revenue_estimates", [])
 
         if not args.quiet:
@@ -368,34 +463,8 @@ def main():
         "model": GEMINI_MODEL
     }
 
-    # Format outputs
-    text_output = format_text_report(data, confidence)
-    json_output = json.dumps(data, indent=2)
-
-    # Output
-    if args.output:
-        base = args.output.rsplit(".", 1)[0] if "." in args.output else args.output
-
-        if args.format in ["json", "both"]:
-            with open(f"{base}.json", "w") as f:
-                f.write(json_output)
-            if not args.quiet:
-                print(f"\n✅ JSON saved to {base}.json")
-
-        if args.format in ["text", "both"]:
-            with open(f"{base}.txt", "w") as f:
-                f.write(text_output)
-            if not args.quiet:
-                print(f"✅ Text saved to {base}.txt")
-    else:
-        if args.format == "json":
-            print(json_output)
-        elif args.format == "text":
-            print(text_output)
-        else:
-            print(text_output)
-            print("\n--- JSON ---\n")
-            print(json_output)
+    write_outputs(output_base(args.output) if args.output else None, data,
+                  lambda w: format_text_report(data, confidence, w), args.format, args.quiet)
 
     if not args.quiet and estimates:
         best = max(estimates, key=lambda x: x.get("credibility_score", 0))